@@ -0,0 +1,283 @@
+import pygame
+import pytest
+
+from conftest import StopInfiniteLoop
+
+
+def test_window_exposure_requests_full_redraw(_the_snake, snake):
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+    assert _the_snake.handle_keys(snake), (
+        'После того как окно снова стало видно, экран нужно перерисовать '
+        'целиком.'
+    )
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP))
+    assert not _the_snake.handle_keys(snake)
+    assert snake.direction == _the_snake.UP
+
+
+def expected_cell_colors(controller):
+    colors = {}
+    for eatable_object in (
+        controller.apple,
+        controller.bad_apple,
+        controller.stone,
+    ):
+        colors[eatable_object.position] = eatable_object.body_color
+    snake = controller.snake
+    for position in snake.positions:
+        colors[position] = snake.body_color
+    colors[snake.positions[0]] = snake.head_color
+    return colors
+
+
+@pytest.mark.timeout(2, method='thread')
+def test_frames_match_game_state(_the_snake, monkeypatch):
+    controllers = []
+
+    class RecordedController(_the_snake.GameController):
+        def __init__(self):
+            super().__init__()
+            controllers.append(self)
+
+    # Cells eaten objects must respawn on, in order
+    respawn_cells = []
+    generate_random_coordinates = _the_snake.generate_random_coordinates
+
+    def respawn_on_given_cell(free_coordinates=None, blocked=()):
+        if respawn_cells:
+            return respawn_cells.pop(0)
+        return generate_random_coordinates(free_coordinates, blocked)
+
+    class FrameChecker:
+        frame = 0
+
+        def tick(self, *args, **kwargs):
+            self.frame += 1
+            controller = controllers[0]
+            snake = controller.snake
+            for cell in _the_snake.ALL_CELLS:
+                expected = expected_cell_colors(controller).get(
+                    cell, _the_snake.BOARD_BACKGROUND_COLOR
+                )
+                center = _the_snake.CELL_RECTS[cell].center
+                actual = tuple(_the_snake.screen.get_at(center))[:3]
+                assert actual == expected, (
+                    f'Кадр {self.frame}: клетка {cell} имеет цвет {actual} '
+                    f'вместо {expected}.'
+                )
+
+            if self.frame == 1:
+                # Keep eatables off snake's way and let it grow
+                controller.apple.position = (0, 0)
+                controller.bad_apple.position = (1, 0)
+                controller.stone.position = (2, 0)
+                controller.update_eatable_lookup()
+                controller.full_redraw = True
+                snake.direction = _the_snake.RIGHT
+                snake.length = 6
+            elif self.frame == 4:
+                # Apple is eaten on the next frame and respawns where
+                #  the head moves to, so it is eaten once more and goes
+                #  off snake's way. It is moved under the current head,
+                #  so only its old cell has to be erased.
+                _the_snake.erase_cell(
+                    _the_snake.screen, controller.apple.position
+                )
+                controller.apple.position = snake.positions[0]
+                controller.update_eatable_lookup()
+                respawn_cells.append(snake.compute_new_head())
+                respawn_cells.append((3, 0))
+            elif self.frame in (8, 11, 12):
+                # Bad apple is eaten on the next frame and respawns
+                #  on the tail cell it cuts off right away
+                _the_snake.erase_cell(
+                    _the_snake.screen, controller.bad_apple.position
+                )
+                controller.bad_apple.position = snake.positions[0]
+                controller.update_eatable_lookup()
+                respawn_cells.append(snake.positions[-1])
+            elif self.frame == 15:
+                raise StopInfiniteLoop
+
+    monkeypatch.setattr(_the_snake, 'GameController', RecordedController)
+    monkeypatch.setattr(
+        _the_snake, 'generate_random_coordinates', respawn_on_given_cell
+    )
+    monkeypatch.setattr(_the_snake, 'clock', FrameChecker())
+    with pytest.raises(StopInfiniteLoop):
+        _the_snake.main()
+    assert not respawn_cells
+    assert controllers[0].snake.length == 5
+
+
+def make_square(the_snake, snake):
+    """Move snake, so its head ends up right below its tail."""
+    snake.length = 4
+    for direction in (the_snake.RIGHT, the_snake.DOWN, the_snake.LEFT):
+        snake.direction = direction
+        snake.move()
+    snake.direction = the_snake.UP
+
+
+def test_head_can_follow_tail(_the_snake, snake):
+    make_square(_the_snake, snake)
+    tail = snake.positions[-1]
+    new_head = snake.compute_new_head()
+    assert new_head == tail
+    assert not snake.bites_itself(new_head), (
+        'Змейка, которая не растёт, может занять клетку своего хвоста.'
+    )
+    snake.commit_move(new_head)
+    assert snake.positions[0] == tail
+    assert len(snake.positions) == len(set(snake.positions)) == snake.length
+
+
+def test_growing_head_bites_tail(_the_snake, snake):
+    make_square(_the_snake, snake)
+    snake.length += 1
+    assert snake.bites_itself(snake.compute_new_head()), (
+        'Растущая змейка не может занять клетку своего хвоста.'
+    )
+
+
+def test_snake_bites_its_body(_the_snake, snake):
+    assert not snake.bites_itself(snake.compute_new_head())
+    make_square(_the_snake, snake)
+    assert snake.bites_itself(snake.positions[1])
+
+
+def test_snake_can_not_reverse_within_one_frame(_the_snake, snake):
+    pygame.event.clear()
+    for key in (pygame.K_UP, pygame.K_LEFT):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+    _the_snake.handle_keys(snake)
+    assert snake.direction == _the_snake.UP, (
+        'Змейка, движущаяся вправо, не должна развернуться влево, даже '
+        'если за один кадр нажаты клавиши вверх и влево.'
+    )
+    snake.move()
+    snake.update_direction(_the_snake.LEFT)
+    assert snake.direction == _the_snake.LEFT
+
+
+def test_shrink_cuts_tail_at_once(_the_snake, snake):
+    snake.length = 3
+    for _ in range(3):
+        snake.move()
+    tail = snake.positions[-1]
+    snake.shrink()
+    assert snake.length == len(snake.positions) == 2, (
+        'Хвост змейки должен укорачиваться сразу после уменьшения длины.'
+    )
+    assert tail not in snake.positions
+    assert snake.vacated_positions[-1] == tail
+    snake.move()
+    assert len(snake.positions) == 2
+
+
+def assert_free_cells_match_positions(the_snake, snake):
+    free_cells = set(snake.free_cells)
+    assert len(free_cells) == len(snake.free_cells), (
+        'Свободные клетки змейки не должны повторяться.'
+    )
+    assert free_cells == set(the_snake.ALL_CELLS) - set(snake.positions), (
+        'Свободными должны быть все клетки поля, кроме клеток змейки.'
+    )
+    assert snake.free_index == {
+        cell: index for index, cell in enumerate(snake.free_cells)
+    }, 'Индекс свободных клеток должен совпадать с их списком.'
+
+
+def test_free_cells_follow_moves(_the_snake, snake):
+    assert_free_cells_match_positions(_the_snake, snake)
+    snake.length = 5
+    for direction in (
+        _the_snake.RIGHT,
+        _the_snake.RIGHT,
+        _the_snake.DOWN,
+        _the_snake.DOWN,
+        _the_snake.LEFT,
+        _the_snake.LEFT,
+        _the_snake.LEFT,
+    ):
+        snake.update_direction(direction)
+        snake.move()
+        assert_free_cells_match_positions(_the_snake, snake)
+    assert len(snake.positions) == snake.length
+
+
+def test_free_cells_follow_moves_over_grid_border(_the_snake, snake):
+    snake.length = 3
+    for _ in range(_the_snake.GRID_WIDTH + 2):
+        snake.move()
+        assert_free_cells_match_positions(_the_snake, snake)
+
+
+def test_free_cells_follow_tail_and_shrink(_the_snake, snake):
+    make_square(_the_snake, snake)
+    snake.move()
+    assert_free_cells_match_positions(_the_snake, snake)
+    snake.shrink()
+    assert_free_cells_match_positions(_the_snake, snake)
+    snake.move()
+    assert_free_cells_match_positions(_the_snake, snake)
+
+
+def test_free_cells_after_reset(_the_snake, snake):
+    snake.length = 4
+    for _ in range(4):
+        snake.move()
+    snake.reset()
+    assert list(snake.positions) == [_the_snake.GRID_CENTER]
+    assert_free_cells_match_positions(_the_snake, snake)
+
+
+@pytest.mark.parametrize(
+    'free_cells, blocked_cells',
+    (
+        ([], ()),
+        ([(1, 1), (2, 2)], ((1, 1), (2, 2))),
+    ),
+    ids=('no_free_cells', 'all_free_cells_blocked'),
+)
+def test_no_coordinates_on_full_grid(_the_snake, free_cells, blocked_cells):
+    assert (
+        _the_snake.generate_random_coordinates(free_cells, blocked_cells)
+        is None
+    ), 'На заполненном поле не должно быть свободных координат.'
+
+
+def test_only_free_cell_is_chosen(_the_snake):
+    for _ in range(20):
+        assert _the_snake.generate_random_coordinates(
+            [(1, 1), (2, 2)], ((1, 1),)
+        ) == (2, 2)
+
+
+def test_game_resets_when_eaten_object_can_not_respawn(_the_snake):
+    controller = _the_snake.GameController()
+    snake = controller.snake
+    snake.length = 3
+    for _ in range(2):
+        snake.move()
+
+    # Only the other two eatables' cells are left free on the grid
+    blocked_cells = (controller.bad_apple.position, controller.stone.position)
+    snake.free_cells[:] = blocked_cells
+    snake.free_index.clear()
+    snake.free_index.update(
+        {cell: index for index, cell in enumerate(blocked_cells)}
+    )
+    controller.apple.position = snake.positions[0]
+    controller.update_eatable_lookup()
+    controller.full_redraw = False
+
+    assert controller.check_snake_collision() is controller.apple
+    assert controller.full_redraw, (
+        'Если съеденному объекту некуда появиться, игра должна начаться '
+        'заново.'
+    )
+    assert list(snake.positions) == [_the_snake.GRID_CENTER]
+    assert controller.apple.position is not None
+    assert_free_cells_match_positions(_the_snake, snake)
@@ -1,11 +1,11 @@
 import abc
-from functools import wraps
-from random import choice, randint
-from typing import Optional, TypeVar
+from collections import deque
+from itertools import islice
+from random import choice, randrange
+from typing import Optional
 
 import pygame
 
-T = TypeVar('T')
 GridCoordinates = tuple[int, int]
 
 pygame.init()
@@ -20,19 +20,64 @@ GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
 GRID_CENTER = (GRID_WIDTH // 2, GRID_HEIGHT // 2)
 
-# Move directions
-UP = (0, -1)
-DOWN = (0, 1)
-LEFT = (-1, 0)
-RIGHT = (1, 0)
-
-DIRECTIONAL_KEYS = (
-    pygame.K_UP,
-    pygame.K_DOWN,
-    pygame.K_LEFT,
-    pygame.K_RIGHT,
+# Coordinates of every cell in the grid
+ALL_CELLS = [
+    (col, row) for col in range(GRID_WIDTH) for row in range(GRID_HEIGHT)
+]
+
+# Index of every cell in ALL_CELLS, copied to track free cells
+ALL_CELLS_INDEX = {cell: index for index, cell in enumerate(ALL_CELLS)}
+
+# Random free cells tried before falling back to filtering blocked ones out
+SPAWN_ATTEMPTS = 8
+
+# Screen area of every grid cell, keyed by cell coordinates
+CELL_RECTS = {
+    (col, row): pygame.Rect(
+        col * GRID_SIZE, row * GRID_SIZE, GRID_SIZE, GRID_SIZE
+    )
+    for col, row in ALL_CELLS
+}
+
+# Move directions, encoded as indices into the tables below
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+
+# Column and row change for each direction
+DX = (0, 0, -1, 1)
+DY = (-1, 1, 0, 0)
+
+# Snake can not turn into the opposite direction
+OPPOSITE = (DOWN, UP, RIGHT, LEFT)
+
+# Next column and row after a move in each direction, already wrapped
+#  around the grid border, e.g. NEXT_X[LEFT][0] == GRID_WIDTH - 1
+NEXT_X = tuple(
+    [(col + dx) % GRID_WIDTH for col in range(GRID_WIDTH)] for dx in DX
+)
+NEXT_Y = tuple(
+    [(row + dy) % GRID_HEIGHT for row in range(GRID_HEIGHT)] for dy in DY
 )
 
+DIRECTIONAL_KEYS = frozenset(
+    (
+        pygame.K_UP,
+        pygame.K_DOWN,
+        pygame.K_LEFT,
+        pygame.K_RIGHT,
+    )
+)
+
+# Event types the game reacts to, all the others are blocked.
+#  Window exposure is handled, as window contents may be lost then.
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED)
+
+KEY_TO_DIRECTION = {
+    pygame.K_UP: UP,
+    pygame.K_DOWN: DOWN,
+    pygame.K_LEFT: LEFT,
+    pygame.K_RIGHT: RIGHT,
+}
+
 BOARD_BACKGROUND_COLOR = (0, 0, 0)
 
 # Cell border color
@@ -48,46 +93,132 @@ SNAKE_HEAD_COLOR = (255, 255, 0)
 # Game speed (in fps)
 SPEED = 10
 
-# Game screen setting
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
+# Game screen setting. Color depth is left for SDL to pick
+#  the native pixel format. Window is a plain software surface,
+#  so display updates only copy the changed areas.
+screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0)
 
 # Game window caption
 pygame.display.set_caption('Змейка')
 
+# Only events handled by the game are put into the event queue
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(HANDLED_EVENTS)
+
 # Game clock
 clock = pygame.time.Clock()
 
 
+def render_cell_surface(color: tuple[int, int, int]) -> pygame.Surface:
+    """Prerender a single cell of given color with its border."""
+    cell_surface = pygame.Surface(CELL_SIZE)
+    cell_surface.fill(color)
+    pygame.draw.rect(cell_surface, BORDER_COLOR, cell_surface.get_rect(), 1)
+    # Match screen pixel format, so blitting is a plain copy
+    return cell_surface.convert()
+
+
+# Prerendered cells for every game object color. Empty cells
+#  have no border and are filled by erase_cell instead.
+_CELL_SURFACES = {
+    color: render_cell_surface(color)
+    for color in (
+        APPLE_COLOR,
+        BAD_APPLE_COLOR,
+        STONE_COLOR,
+        SNAKE_COLOR,
+        SNAKE_HEAD_COLOR,
+    )
+}
+
+
 def draw_cell(
     surface: pygame.Surface,
     position: GridCoordinates,
-    color: tuple[int, int, int] = BOARD_BACKGROUND_COLOR,
-) -> None:
+    color: tuple[int, int, int],
+) -> pygame.Rect:
     """Fills one rectangle cell on the grid."""
-    rect = pygame.Rect(position, CELL_SIZE)
-    pygame.draw.rect(surface, color, rect)
-    pygame.draw.rect(surface, BORDER_COLOR, rect, 1)
+    rect = CELL_RECTS[position]
+    surface.blit(_CELL_SURFACES[color], rect)
+    return rect
+
+
+def erase_cell(
+    surface: pygame.Surface,
+    position: GridCoordinates,
+) -> pygame.Rect:
+    """Fills one rectangle cell on the grid with background color."""
+    rect = CELL_RECTS[position]
+    surface.fill(BOARD_BACKGROUND_COLOR, rect)
+    return rect
 
 
 def generate_random_coordinates(
-    occupied_coordinates: Optional[list[GridCoordinates]] = None,
-) -> GridCoordinates:
-    """Generate random unoccupied coordinates in the grid."""
-    if occupied_coordinates is None:
-        occupied_coordinates = []
+    free_coordinates: Optional[list[GridCoordinates]] = None,
+    blocked_coordinates: tuple[GridCoordinates, ...] = (),
+) -> Optional[GridCoordinates]:
+    """Generate random unoccupied coordinates in the grid.
+
+    Free coordinates are usually the cells not taken by the snake,
+    blocked ones are a few single cells, like positions of other objects.
+    Returns None if there is no unoccupied cell left.
+    """
+    if free_coordinates is None:
+        free_coordinates = ALL_CELLS
+
+    # Random cell is drawn from free ones, so only the few blocked cells
+    #  can make it miss, no matter how much of the grid is occupied.
+    if free_coordinates:
+        for _ in range(SPAWN_ATTEMPTS):
+            coordinates = free_coordinates[randrange(len(free_coordinates))]
+            if coordinates not in blocked_coordinates:
+                return coordinates
+
+    # Almost all free cells are blocked, leave only the available ones
+    available_coordinates = [
+        coordinates
+        for coordinates in free_coordinates
+        if coordinates not in blocked_coordinates
+    ]
+    if not available_coordinates:
+        return None
+
+    return choice(available_coordinates)
+
+
+def handle_keys(
+    snake: 'Snake',
+    quit_event: int = pygame.QUIT,
+    exposed_event: int = pygame.WINDOWEXPOSED,
+    handled_events: tuple[int, ...] = HANDLED_EVENTS,
+    directional_keys: frozenset[int] = DIRECTIONAL_KEYS,
+) -> bool:
+    """Reads and handles all events from pygame.
+
+    Constants are bound as default arguments, so the per-frame code
+    reads them as locals instead of module attributes.
+    Event queue is pumped and drained exactly once per frame.
+    Returns True if the whole screen must be repainted.
+    """
+    full_redraw = False
 
-    while True:
-        coordinates = (
-            randint(0, GRID_WIDTH - 1),
-            randint(0, GRID_HEIGHT - 1),
-        )
+    # Filtering is done by pygame, so the list only holds handled events
+    for event in pygame.event.get(eventtype=handled_events):
+        # Handle quit event, e.g. window closing.
+        if event.type == quit_event:
+            pygame.quit()
+            raise SystemExit
+
+        # Window has been uncovered or restored and its contents
+        #  may be lost, so only changed cells are not enough.
+        if event.type == exposed_event:
+            full_redraw = True
 
-        # If generated coordinates do not collide
-        #  with any of occupied coordinates, exit loop
-        if coordinates not in occupied_coordinates:
-            break
+        # Only key presses are left, no need to check event type
+        elif event.key in directional_keys:
+            snake.handle_key_press(event.key)
 
-    return coordinates
+    return full_redraw
 
 
 class GameController:
@@ -101,65 +232,82 @@ class GameController:
         self.bad_apple = BadApple()
         self.stone = Stone()
 
-    def handle_events(self) -> None:
-        """Reads and handles all events from pygame."""
-        for event in pygame.event.get():
-            # Handle quit event, e.g. window closing.
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                raise SystemExit
+        # Eatable objects keyed by their position, so the snake's head
+        #  is checked against all of them with a single lookup
+        self.eatable_lookup: dict[GridCoordinates, EatableObject] = {}
+        self.respawn_eatables()
 
-            if event.type == pygame.KEYDOWN and event.key in DIRECTIONAL_KEYS:
-                self.snake.handle_key_press(event.key)
+        # Whole screen must be repainted on the first frame
+        self.full_redraw = True
 
-    # Probably better as a separate function, but needs some way to get positions on the grid
     @property
-    def occupied_coordinates(self) -> list[GridCoordinates]:
-        """Get a list of all occupied positions inside the grid."""
-        return self.snake.positions + [
+    def eatable_positions(self) -> tuple[GridCoordinates, ...]:
+        """Get positions of all eatable objects inside the grid.
+
+        Together with snake's body these are all occupied cells,
+        so no combined collection has to be built on every spawn.
+        """
+        return (
             self.apple.position,
             self.bad_apple.position,
             self.stone.position,
-        ]
+        )
+
+    def update_eatable_lookup(self) -> None:
+        """Rebuilds eatable objects lookup after any of them moved."""
+        self.eatable_lookup = {
+            self.apple.position: self.apple,
+            self.bad_apple.position: self.bad_apple,
+            self.stone.position: self.stone,
+        }
+
+    def respawn_eatables(self) -> None:
+        """Moves all eatable objects to random free cells."""
+        free_cells = self.snake.free_cells
+        self.apple.randomize_position(free_cells, self.eatable_positions)
+        self.bad_apple.randomize_position(free_cells, self.eatable_positions)
+        self.stone.randomize_position(free_cells, self.eatable_positions)
+        self.update_eatable_lookup()
 
     def reset(self) -> None:
         """Resets the game."""
+        self.full_redraw = True
         self.snake.reset()
-        self.apple.randomize_position(self.occupied_coordinates)
-        self.bad_apple.randomize_position(self.occupied_coordinates)
-        self.stone.randomize_position(self.occupied_coordinates)
+        self.respawn_eatables()
 
-    def check_snake_collision(self) -> None:
-        """Checks if snake collides with anything and if it does,
-        handles this event.
+    def check_snake_collision(self) -> Optional['EatableObject']:
+        """Lets the snake eat an object under its head, if there is one.
+
+        Collision with snake's own body is checked separately, before
+        the move. Returns the eaten object, if there is one.
         """
-        snake = self.snake
-
-        # FIXME: A lot of duplicate code, probably there's a way to refactor.
-        # If snake eats apple, increase its length by 1
-        if snake.get_head_position() == self.apple.position:
-            snake.eat(self.apple, self.occupied_coordinates)
-            return
-
-        # If snake eats bad apple, decrease its length by 1.
-        if snake.get_head_position() == self.bad_apple.position:
-            snake.eat(self.bad_apple, self.occupied_coordinates)
-            return
-
-        # If snake eats a stone, it dies from indigestion. Game is reset.
-        if snake.get_head_position() == self.stone.position:
-            snake.eat(self.stone, self.occupied_coordinates)
-            return
-
-        # If snake eats its own body, it dies. Game is reset.
-        if snake.get_head_position() in snake.positions[1:]:
+        # Head is read straight from positions, as this runs every frame
+        eatable_object = self.eatable_lookup.get(self.snake.positions[0])
+        if eatable_object is None:
+            return None
+
+        # Each object applies its own effect: apple increases snake's
+        #  length by 1, bad apple decreases it by 1 and stone makes
+        #  the snake die from indigestion.
+        self.snake.eat(eatable_object, self.eatable_positions)
+
+        # If snake length reaches 0, then it dies. The game must be reset.
+        #  Length only changes when something is eaten, so it is not
+        #  checked on every frame. Game is over as well if the snake
+        #  fills the grid, so eaten object has nowhere to respawn.
+        if self.snake.length == 0 or eatable_object.position is None:
             self.reset()
-            return
+        else:
+            self.update_eatable_lookup()
+
+        return eatable_object
 
 
 class GameObject:
     """Base game object."""
 
+    __slots__ = ('body_color', 'position')
+
     def __init__(self) -> None:
         self.position = GRID_CENTER
         self.body_color = None
@@ -168,16 +316,12 @@ class GameObject:
         """Draw game object on the game screen."""
         pass
 
-    @property
-    def screen_position(self) -> GridCoordinates:
-        """Object's true position on screen."""
-        col, row = self.position
-        return (col * GRID_SIZE, row * GRID_SIZE)
-
 
 class EatableObject(GameObject, abc.ABC):
     """An object that the Snake can eat."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -192,24 +336,30 @@ class EatableObject(GameObject, abc.ABC):
         pass
 
     def randomize_position(
-        self, occupied_coordinates: Optional[list[GridCoordinates]] = None
+        self,
+        free_coordinates: Optional[list[GridCoordinates]] = None,
+        blocked_coordinates: tuple[GridCoordinates, ...] = (),
     ) -> None:
         """Set object position to a random cell inside the grid."""
-        # Object can not be spawned in occupied coordinates.
-        if occupied_coordinates is None:
-            occupied_coordinates = []  # Probably better to block some coordinates in this case
+        # Object can only be spawned in free coordinates.
+        #  If those are not given, any cell of the grid is free.
+        #  Position is set to None if the grid is full.
 
         # Get random available coordinates and set it to self position
-        self.position = generate_random_coordinates(occupied_coordinates)
+        self.position = generate_random_coordinates(
+            free_coordinates, blocked_coordinates
+        )
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
         """Draws an object on game screen."""
-        draw_cell(surface, self.screen_position, self.body_color)
+        return draw_cell(surface, self.position, self.body_color)
 
 
 class Apple(EatableObject):
     """An apple. Used as food for the snake."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         self.body_color = APPLE_COLOR
@@ -224,18 +374,22 @@ class BadApple(EatableObject):
     Eating it will cause snake to lose its length.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         self.body_color = BAD_APPLE_COLOR
 
     def apply_effect(self, snake: 'Snake') -> None:
         """Decrease snake's length by 1."""
-        snake.length -= 1
+        snake.shrink()
 
 
 class Stone(EatableObject):
     """Some stone, lying in the field. Snake can't digest it."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         self.body_color = STONE_COLOR
@@ -252,18 +406,52 @@ class Snake(GameObject):
     The snake can move in 4 direction as well as grow when eating.
     """
 
+    __slots__ = (
+        'direction',
+        'free_cells',
+        'free_index',
+        'head_color',
+        'last_move_direction',
+        'length',
+        'positions',
+        'vacated_positions',
+    )
+
     def __init__(self) -> None:
         super().__init__()
 
         self.body_color = SNAKE_COLOR
-        self.head_color = SNAKE_HEAD_COLOR
+        self.head_color: tuple[int, int, int] = SNAKE_HEAD_COLOR
 
-        self.direction = RIGHT
-        self.next_direction = None
+        self.direction: int = RIGHT
+        # Direction of the last move made, to check turns against
+        self.last_move_direction: int = RIGHT
 
-        self.length = 1
+        self.length: int = 1
         # Snake starts at the grid center
-        self.positions = [GRID_CENTER]
+        self.positions: deque[GridCoordinates] = deque([GRID_CENTER])
+        # All the other cells in the grid, used to spawn objects.
+        #  Index of each free cell in the list is kept in a dict,
+        #  so a cell is taken or released in O(1).
+        self.free_cells: list[GridCoordinates] = ALL_CELLS.copy()
+        self.free_index: dict[GridCoordinates, int] = ALL_CELLS_INDEX.copy()
+        self.take_cell(GRID_CENTER)
+        # Cells left by the snake since last draw, must be erased
+        self.vacated_positions: list[GridCoordinates] = []
+
+    def take_cell(self, position: GridCoordinates) -> None:
+        """Removes a cell from free cells, as snake's body now takes it."""
+        index = self.free_index.pop(position)
+        last_cell = self.free_cells.pop()
+        # Last free cell is moved into the gap, unless it is the one taken
+        if last_cell != position:
+            self.free_cells[index] = last_cell
+            self.free_index[last_cell] = index
+
+    def release_cell(self, position: GridCoordinates) -> None:
+        """Returns a cell left by snake's body to free cells."""
+        self.free_index[position] = len(self.free_cells)
+        self.free_cells.append(position)
 
     def get_head_position(self) -> GridCoordinates:
         """Snake's head position (First square in snake positions)."""
@@ -272,80 +460,157 @@ class Snake(GameObject):
     def eat(
         self,
         eatable_object: EatableObject,
-        occupied_coordinates: Optional[list[GridCoordinates]],
+        blocked_coordinates: tuple[GridCoordinates, ...] = (),
     ) -> None:
-        """Eats something."""
+        """Eats something.
+
+        Eaten object is respawned outside of snake's body
+        and blocked coordinates.
+        """
         eatable_object.apply_effect(self)
-        eatable_object.randomize_position(occupied_coordinates)
+        eatable_object.randomize_position(self.free_cells, blocked_coordinates)
 
-    def move(self) -> None:
-        """Moves the snake's head in current direction.
+    def compute_new_head(
+        self,
+        next_x: tuple[list[int], ...] = NEXT_X,
+        next_y: tuple[list[int], ...] = NEXT_Y,
+    ) -> GridCoordinates:
+        """Position of snake's head after the move in current direction.
 
-        Inserts new head position in positions list.
-        If snake does not grow on this move, deletes last position.
+        Move tables are bound as default arguments to be read as locals.
         """
-        col, row = self.get_head_position()
-        add_col, add_row = self.direction
-
-        # Mod division is used to fix values which go
-        #  over limit of the grid
-        new_position = (
-            (col + add_col) % GRID_WIDTH,
-            (row + add_row) % GRID_HEIGHT,
+        col, row = self.positions[0]
+        direction = self.direction
+
+        # New coordinates are precomputed, including the ones
+        #  which go over limit of the grid
+        return (next_x[direction][col], next_y[direction][row])
+
+    def bites_itself(self, new_position: GridCoordinates) -> bool:
+        """Checks if moving the head to new position hits snake's body."""
+        if new_position in self.free_index:
+            return False
+
+        # Unless snake is growing, its tail leaves the cell on this move,
+        #  so the head is free to take its place.
+        return (
+            new_position != self.positions[-1]
+            or len(self.positions) < self.length
         )
 
+    def cut_tail(self) -> None:
+        """Removes snake's last segment."""
+        tail = self.positions.pop()
+        self.release_cell(tail)
+        self.vacated_positions.append(tail)
+
+    def shrink(self) -> None:
+        """Decreases snake's length by 1 right away.
+
+        Tail is cut at once, so a move never has to remove
+        more than one segment.
+        """
+        self.length -= 1
+        self.cut_tail()
+
+    def commit_move(self, new_position: GridCoordinates) -> None:
+        """Moves the snake's head to new position.
+
+        Inserts new head position in positions deque.
+        If snake does not grow on this move, deletes last position.
+        """
+        # If snake's not growing, remove last position.
+        #  Tail is removed before the head is inserted, so the head
+        #  can take the cell the tail has just left.
+        if len(self.positions) >= self.length:
+            self.cut_tail()
+
         # Insert new position as snake's head
-        self.positions.insert(0, new_position)
+        self.positions.appendleft(new_position)
+        self.take_cell(new_position)
+        self.last_move_direction = self.direction
 
-        # If snake's not growing, remove last position
-        while len(self.positions) > self.length:
-            self.positions.pop()
+    def move(self) -> None:
+        """Moves the snake's head in current direction."""
+        self.commit_move(self.compute_new_head())
 
     def handle_key_press(self, key_id: int) -> None:
-        """Chooses snake's next direction based on pressed
-        directional key.
+        """Chooses snake's direction based on pressed directional key."""
+        direction = KEY_TO_DIRECTION.get(key_id)
+        if direction is not None:
+            self.update_direction(direction)
+
+    def update_direction(self, direction: int) -> None:
+        """Updates snake direction with a new value.
+
+        Snake can not reverse, so opposite direction is ignored.
+        Turns are checked against the last move made, not the current
+        direction, which an earlier key in the same frame may have
+        changed already.
         """
-        if key_id == pygame.K_UP and self.direction != DOWN:
-            self.next_direction = UP
-        elif key_id == pygame.K_DOWN and self.direction != UP:
-            self.next_direction = DOWN
-        elif key_id == pygame.K_LEFT and self.direction != RIGHT:
-            self.next_direction = LEFT
-        elif key_id == pygame.K_RIGHT and self.direction != LEFT:
-            self.next_direction = RIGHT
-
-        self.update_direction()
-
-    def update_direction(self) -> None:
-        """Updates snake direction with a new value."""
-        if self.next_direction:
-            self.direction = self.next_direction
-            self.next_direction = None
-
-    @property
-    def screen_positions(self) -> list[GridCoordinates]:
-        """Snake segments true position on screen."""
-        return list(
-            map(
-                lambda pos: (pos[0] * GRID_SIZE, pos[1] * GRID_SIZE),
-                self.positions,
-            )
-        )
+        if direction != OPPOSITE[self.last_move_direction]:
+            self.direction = direction
 
     def reset(self) -> None:
         """Resets snake on collision with self."""
-        self.positions = [GRID_CENTER]
+        # Snake's containers are reused, only their content is replaced
+        self.positions.clear()
+        self.positions.append(GRID_CENTER)
+        self.free_cells[:] = ALL_CELLS
+        self.free_index.clear()
+        self.free_index.update(ALL_CELLS_INDEX)
+        self.take_cell(GRID_CENTER)
+        # Old body is wiped by a full redraw, nothing is left to erase
+        self.vacated_positions.clear()
         self.length = 1
         self.direction = choice((UP, DOWN, LEFT, RIGHT))
+        self.last_move_direction = self.direction
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draw snake on the game screen."""
-        positions = self.screen_positions
+        draw_cell(surface, self.get_head_position(), self.head_color)
+
+        # Whole body is drawn with a single blits call
+        body_surface = _CELL_SURFACES[self.body_color]
+        surface.blits(
+            [
+                (body_surface, CELL_RECTS[position])
+                for position in islice(self.positions, 1, None)
+            ],
+            doreturn=False,
+        )
+
+        self.vacated_positions.clear()
+
+    def erase_vacated(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """Erase cells left by the snake since last draw.
+
+        Returns list of changed screen areas.
+        """
+        changed_rects = [
+            erase_cell(surface, position)
+            for position in self.vacated_positions
+        ]
+        self.vacated_positions.clear()
+        return changed_rects
+
+    def draw_moved_head(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """Redraw the head cells changed by the last move.
+
+        Repaints previous head with body color and draws the new head.
+        Returns list of changed screen areas.
+        """
+        changed_rects = []
+        if len(self.positions) > 1:
+            changed_rects.append(
+                draw_cell(surface, self.positions[1], self.body_color)
+            )
 
-        draw_cell(surface, positions[0], self.head_color)
+        changed_rects.append(
+            draw_cell(surface, self.positions[0], self.head_color)
+        )
 
-        for position in positions[1:]:
-            draw_cell(surface, position, self.body_color)
+        return changed_rects
 
 
 def main() -> None:
@@ -359,32 +624,66 @@ def main() -> None:
     bad_apple = controller.bad_apple
     stone = controller.stone
 
-    while True:
-        # Read and handle events
-        controller.handle_events()
-
-        # Clear screen
-        screen.fill(BOARD_BACKGROUND_COLOR)
-
-        # Check if snake collides with anything.
-        #  If it does, handle this event.
-        controller.check_snake_collision()
+    # Methods and functions called on every frame are bound to locals
+    #  once, so the loop does not look them up again on each iteration.
+    check_snake_collision = controller.check_snake_collision
+    compute_new_head = snake.compute_new_head
+    bites_itself = snake.bites_itself
+    commit_move = snake.commit_move
+    erase_vacated = snake.erase_vacated
+    draw_moved_head = snake.draw_moved_head
+    update_display = pygame.display.update
 
-        # If snake length reaches 0, then it dies.
-        #  The game must be reset.
-        if snake.length == 0:
+    while True:
+        # Read and handle events. Window may need a full repaint.
+        if handle_keys(snake):
+            controller.full_redraw = True
+
+        # Snake eats an object under its head, if there is one.
+        #  Game is reset if snake dies from eaten object.
+        eaten_object = check_snake_collision()
+
+        # Snake's body is checked before the head is moved,
+        #  so the snake never overlaps itself on screen.
+        new_head = compute_new_head()
+        if bites_itself(new_head):
+            # If snake eats its own body, it dies. Game is reset.
             controller.reset()
-
-        snake.move()
-
-        # Draw all game objects
-        apple.draw(screen)
-        bad_apple.draw(screen)
-        stone.draw(screen)
-
-        snake.draw(screen)
-
-        pygame.display.update()
+            snake.move()
+        else:
+            commit_move(new_head)
+
+        if controller.full_redraw:
+            # Game has been (re)started, repaint the whole screen
+            screen.fill(BOARD_BACKGROUND_COLOR)
+            apple.draw(screen)
+            bad_apple.draw(screen)
+            stone.draw(screen)
+            snake.draw(screen)
+            dirty_rects = [screen.get_rect()]
+            controller.full_redraw = False
+        else:
+            # Snake changes by a few cells per move, repaint only those.
+            #  Cells left by its tail are erased first.
+            dirty_rects = erase_vacated(screen)
+
+            # Eatable object only moves when eaten. Its old cell is
+            #  repainted as snake's body below. It is drawn between
+            #  erasing and drawing the head, as it may have respawned
+            #  on a cell just left by the tail (bad apple cuts it
+            #  at once) or on the cell the head has just moved to.
+            if eaten_object is not None:
+                dirty_rects.append(eaten_object.draw(screen))
+
+            dirty_rects += draw_moved_head(screen)
+
+        # Only changed areas of the screen are sent to the display
+        update_display(dirty_rects)
+
+        # Sleep until next frame. Clock.tick puts the process to sleep
+        #  instead of spinning, so idle CPU usage is already near zero.
+        #  Events arriving meanwhile are handled in one batch
+        #  at the start of the next frame.
         clock.tick(SPEED)
 
 